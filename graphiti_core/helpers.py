@@ -37,6 +37,9 @@ SEMAPHORE_LIMIT = int(os.getenv('SEMAPHORE_LIMIT', 20))
 MAX_REFLEXION_ITERATIONS = int(os.getenv('MAX_REFLEXION_ITERATIONS', 0))
 DEFAULT_PAGE_LIMIT = 20
 
+# Pattern matches: letters (a-z, A-Z), digits (0-9), hyphens (-), and underscores (_)
+GROUP_ID_PATTERN = re.compile(r'^[a-zA-Z0-9_-]+$')
+
 
 def parse_db_date(input_date: neo4j_time.DateTime | str | None) -> datetime | None:
     if isinstance(input_date, neo4j_time.DateTime):
@@ -135,8 +138,7 @@ def validate_group_id(group_id: str | None) -> bool:
         return True
 
     # Check if string contains only ASCII alphanumeric characters, dashes, or underscores
-    # Pattern matches: letters (a-z, A-Z), digits (0-9), hyphens (-), and underscores (_)
-    if not re.match(r'^[a-zA-Z0-9_-]+$', group_id):
+    if not GROUP_ID_PATTERN.match(group_id):
         raise GroupIdValidationError(group_id)
 
     return True
@@ -2,12 +2,73 @@
 
 import asyncio
 import logging
+import os
+import random
+import time
 from collections.abc import Awaitable, Callable
 from datetime import datetime, timezone
 from typing import Any
 
+from graphiti_core.errors import EntityTypeValidationError, GroupIdValidationError
+
 logger = logging.getLogger(__name__)
 
+# Retry tuning for the queue workers. Failed episodes are retried with
+# full-jitter exponential backoff so that simultaneous failures (e.g. an LLM
+# provider or database outage) don't all wake and retry at the same instant.
+# Both knobs are environment-configurable so deployments can bound worst-case
+# worker occupancy (MAX_RETRIES * MAX_BACKOFF_SECONDS) to match their traffic.
+MAX_RETRIES = int(os.getenv('EPISODE_MAX_RETRIES', 5))
+BACKOFF_BASE = 3
+MAX_BACKOFF_SECONDS = int(os.getenv('EPISODE_MAX_BACKOFF', 30))
+
+# Errors that indicate a bad episode rather than a transient downstream
+# failure; retrying these can never succeed, so they fail immediately. The
+# graphiti_core validation errors are what add_episode raises for bad
+# entity_types/group_id input.
+NON_RETRYABLE_ERRORS: tuple[type[Exception], ...] = (
+    TypeError,
+    ValueError,
+    KeyError,
+    EntityTypeValidationError,
+    GroupIdValidationError,
+)
+
+
+class CircuitBreaker:
+    """Trips after repeated consecutive failures so a downstream outage
+    short-circuits new attempts instead of burning full retry budgets.
+
+    Normal operation is 'closed'. After `failure_threshold` consecutive
+    failures the breaker opens and attempts are rejected; once `reset_timeout`
+    seconds have elapsed, attempts are admitted again (half-open) - a success
+    closes the breaker, while a further failure re-opens it for another
+    `reset_timeout` window. Note that every worker probing during the
+    half-open window is admitted, not just one.
+    """
+
+    def __init__(self, failure_threshold: int = 10, reset_timeout: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._consecutive_failures = 0
+        self._opened_at: float | None = None
+
+    def allow(self) -> bool:
+        """Check whether an attempt may proceed."""
+        if self._opened_at is None:
+            return True
+        # Half-open: allow a probe once the reset timeout has elapsed
+        return time.monotonic() - self._opened_at >= self.reset_timeout
+
+    def record_success(self) -> None:
+        self._consecutive_failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        self._consecutive_failures += 1
+        if self._consecutive_failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+
 
 class QueueService:
     """Service for managing sequential episode processing queues by group_id."""
@@ -20,6 +81,9 @@ class QueueService:
         self._queue_workers: dict[str, bool] = {}
         # Store the graphiti client after initialization
         self._graphiti_client: Any = None
+        # Shared breaker so a persistent downstream outage stops all workers
+        # from piling retries onto the failing service
+        self._breaker = CircuitBreaker()
 
     async def add_episode_task(
         self, group_id: str, process_func: Callable[[], Awaitable[None]]
@@ -62,12 +126,8 @@ class QueueService:
                 process_func = await self._episode_queues[group_id].get()
 
                 try:
-                    # Process the episode
-                    await process_func()
-                except Exception as e:
-                    logger.error(
-                        f'Error processing queued episode for group_id {group_id}: {str(e)}'
-                    )
+                    # Process the episode, retrying transient failures
+                    await self._run_with_retries(group_id, process_func)
                 finally:
                     # Mark the task as done regardless of success/failure
                     self._episode_queues[group_id].task_done()
@@ -79,6 +139,49 @@ class QueueService:
             self._queue_workers[group_id] = False
             logger.info(f'Stopped episode queue worker for group_id: {group_id}')
 
+    async def _run_with_retries(
+        self, group_id: str, process_func: Callable[[], Awaitable[None]]
+    ) -> None:
+        """Run an episode task, retrying failures with jittered exponential backoff.
+
+        Exceptions are logged rather than propagated so a failing episode never
+        kills the queue worker.
+        """
+        for attempt in range(MAX_RETRIES + 1):
+            if not self._breaker.allow():
+                logger.error(
+                    f'Circuit breaker open; dropping episode for group_id {group_id} '
+                    f'without retrying'
+                )
+                return
+            try:
+                await process_func()
+                self._breaker.record_success()
+                return
+            except NON_RETRYABLE_ERRORS as e:
+                # Bad input, not downstream health: fail fast, don't trip the breaker
+                logger.error(
+                    f'Non-retryable error processing episode for group_id {group_id}: {str(e)}'
+                )
+                return
+            except Exception as e:
+                self._breaker.record_failure()
+                if attempt >= MAX_RETRIES:
+                    logger.error(
+                        f'Error processing queued episode for group_id {group_id} '
+                        f'after {MAX_RETRIES} retries: {str(e)}'
+                    )
+                    return
+                # Full jitter: sleep a random amount up to the capped exponential
+                # delay so concurrent failures spread out instead of herding.
+                delay = random.uniform(0, min(BACKOFF_BASE**attempt, MAX_BACKOFF_SECONDS))
+                logger.warning(
+                    f'Episode processing failed for group_id {group_id} '
+                    f'(attempt {attempt + 1}/{MAX_RETRIES + 1}), '
+                    f'retrying in {delay:.1f}s: {str(e)}'
+                )
+                await asyncio.sleep(delay)
+
     def get_queue_size(self, group_id: str) -> int:
         """Get the current queue size for a group_id."""
         if group_id not in self._episode_queues:
@@ -125,6 +228,10 @@ class QueueService:
         if self._graphiti_client is None:
             raise RuntimeError('Queue service not initialized. Call initialize() first.')
 
+        # Capture the reference time at enqueue so it reflects when the episode
+        # was submitted rather than when the worker eventually picks it up.
+        reference_time = datetime.now(timezone.utc)
+
         async def process_episode():
             """Process the episode using the graphiti client."""
             try:
@@ -137,7 +244,7 @@ class QueueService:
                     source_description=source_description,
                     source=episode_type,
                     group_id=group_id,
-                    reference_time=datetime.now(timezone.utc),
+                    reference_time=reference_time,
                     entity_types=entity_types,
                     uuid=uuid,
                 )